@@ -28,6 +28,7 @@ The backend exposes file operations on the same VFS used by bash::
 
 from __future__ import annotations
 
+import asyncio
 import secrets
 import shlex
 import uuid
@@ -37,7 +38,7 @@ from typing import TYPE_CHECKING
 from bashkit import BashTool as NativeBashTool
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import AsyncIterator
 
 # Check for deepagents availability
 try:
@@ -76,6 +77,38 @@ def _build_write_cmd(file_path: str, content: str) -> str:
     return f"cat > {shlex.quote(file_path)} << '{delimiter}'\n{content}\n{delimiter}"
 
 
+async def _stream_execute(bash_instance: NativeBashTool, script: str) -> AsyncIterator[str]:
+    """Yield interleaved stdout/stderr chunks while ``script`` executes.
+
+    Bridges the native ``on_output`` callback onto the running event loop via
+    a queue so callers see output as the interpreter produces it, instead of
+    one fully buffered string after the script completes. The callback may
+    fire on a runtime worker thread, hence ``call_soon_threadsafe``.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    def on_output(stdout: str, stderr: str) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, stdout + stderr)
+
+    async def run():
+        try:
+            return await bash_instance.execute(script, on_output=on_output)
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, None)  # end-of-stream
+
+    task = asyncio.ensure_future(run())
+    while True:
+        chunk = await queue.get()
+        if chunk is None:
+            break
+        if chunk:
+            yield chunk
+    result = await task
+    if result.error:
+        yield f"\nError: {result.error}"
+
+
 def _make_bash_tool(bash_instance: NativeBashTool, max_output_length: int = 100_000):
     """Create a bash tool function from a BashTool instance."""
     # Use name and description from bashkit lib
@@ -222,7 +255,14 @@ if DEEPAGENTS_AVAILABLE:
             return ExecuteResponse(output=output, exit_code=result.exit_code, truncated=False)
 
         async def aexecute(self, command: str) -> ExecuteResponse:
-            return self.execute(command)
+            # Await the native async entry instead of delegating to the sync
+            # path: execute_sync would block the event loop for the whole
+            # script, serializing concurrent agent work.
+            result = await self._bash.execute(command)
+            output = result.stdout + (result.stderr or "")
+            if result.error and result.error not in output:
+                output += f"\nError: {result.error}"
+            return ExecuteResponse(output=output, exit_code=result.exit_code, truncated=False)
 
         # === File Operations ===
 
@@ -379,6 +419,18 @@ if DEEPAGENTS_AVAILABLE:
                 output += f"\nError: {result.error}"
             return output
 
+        def setup_stream(self, script: str) -> AsyncIterator[str]:
+            """Streaming variant of :meth:`setup`.
+
+            Yields output chunks as the interpreter produces them, so large
+            fixture scripts give progress feedback and the event loop stays
+            free for concurrent startup work::
+
+                >>> async for chunk in backend.setup_stream(SETUP):
+                ...     sys.stdout.write(chunk)
+            """
+            return _stream_execute(self._bash, script)
+
         def reset(self) -> None:
             """Reset VFS."""
             self._bash.reset()
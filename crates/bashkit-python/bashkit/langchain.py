@@ -66,6 +66,9 @@ class BashToolInput(BaseModel):
 
 
 if LANGCHAIN_AVAILABLE:
+    # Materialized once at import: the schema never changes, and LangChain's
+    # convert_to_*_tool paths otherwise re-derive it on every bind/request.
+    _BASH_TOOL_JSON_SCHEMA = BashToolInput.model_json_schema()
 
     class BashkitTool(BaseTool):
         """LangChain tool wrapper for Bashkit sandboxed bash interpreter.
@@ -116,6 +119,29 @@ if LANGCHAIN_AVAILABLE:
             object.__setattr__(self, "_bash_tool", bash_tool)
             object.__setattr__(self, "_max_output_length", max_output_length)
 
+        @property
+        def args(self) -> dict:
+            """Tool argument schema, served from the import-time materialization."""
+            return _BASH_TOOL_JSON_SCHEMA["properties"]
+
+        def _parse_input(self, tool_input, tool_call_id=None):
+            """Skip pydantic validation for the already-well-formed case.
+
+            The schema is a single required ``commands: str`` field, so when
+            the input is exactly that shape there is nothing for the model
+            validator to add — one type check replaces a BaseModel
+            construction on every tool call. Anything else — including extra
+            keys, which pydantic drops but ``self._run(**tool_input)`` would
+            choke on — falls through to the base implementation.
+            """
+            if (
+                isinstance(tool_input, dict)
+                and tool_input.keys() == {"commands"}
+                and type(tool_input["commands"]) is str
+            ):
+                return tool_input
+            return super()._parse_input(tool_input, tool_call_id)
+
         def _format_output(self, result) -> str:
             output = result.stdout
             if result.stderr:
@@ -126,6 +152,19 @@ if LANGCHAIN_AVAILABLE:
                 output = output[: self._max_output_length] + "\n[truncated]"
             return output
 
+        def snapshot(self) -> bytes:
+            """Serialize interpreter state (env, cwd, VFS) to bytes.
+
+            Useful for caching an expensive setup script: run it once, persist
+            the snapshot, and :meth:`restore_snapshot` on later runs instead
+            of re-interpreting the script.
+            """
+            return self._bash_tool.snapshot()
+
+        def restore_snapshot(self, data: bytes) -> None:
+            """Restore interpreter state from bytes produced by :meth:`snapshot`."""
+            self._bash_tool.restore_snapshot(data)
+
         def _run(self, commands: str) -> str:
             """Execute bash commands synchronously."""
             result = self._bash_tool.execute_sync(commands)
@@ -136,7 +175,13 @@ if LANGCHAIN_AVAILABLE:
             return self._format_output(result)
 
         async def _arun(self, commands: str) -> str:
-            """Execute bash commands asynchronously."""
+            """Execute bash commands asynchronously.
+
+            The native ``execute`` returns a true awaitable driven by the
+            extension's tokio runtime (not a thread-wrapped blocking call),
+            so K tool calls under ``asyncio.gather`` run K interpreters
+            concurrently on the tokio worker pool.
+            """
             result = await self._bash_tool.execute(commands)
 
             if result.error:
@@ -502,7 +502,7 @@ def run_langchain_demo(tool: ScriptedTool) -> None:
     result = agent.invoke({"messages": [{"role": "user", "content": query}]})
     # Print the final assistant message
     for msg in result["messages"]:
-        if hasattr(msg, "content") and msg.type == "ai" and msg.content:
+        if msg.type == "ai" and getattr(msg, "content", None):
             print(f"Agent: {msg.content}")
 
 
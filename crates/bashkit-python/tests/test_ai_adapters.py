@@ -38,6 +38,23 @@ def test_langchain_create_scripted_tool_without_langchain():
             create_scripted_tool(st)
 
 
+def test_langchain_tool_snapshot_round_trip():
+    """BashkitTool.snapshot/restore_snapshot round-trip interpreter state."""
+    from bashkit.langchain import LANGCHAIN_AVAILABLE, create_bash_tool
+
+    if not LANGCHAIN_AVAILABLE:
+        pytest.skip("langchain-core not installed")
+
+    tool = create_bash_tool()
+    tool.invoke({"commands": "mkdir -p /w && echo data > /w/f.txt"})
+    data = tool.snapshot()
+    assert isinstance(data, bytes)
+
+    restored = create_bash_tool()
+    restored.restore_snapshot(data)
+    assert restored.invoke({"commands": "cat /w/f.txt"}).strip() == "data"
+
+
 def test_langchain_all_exports():
     """langchain __all__ contains expected symbols."""
     from bashkit.langchain import __all__
@@ -95,6 +112,22 @@ def test_deepagents_now_iso():
     assert "T" in ts  # ISO format has T separator
 
 
+@pytest.mark.asyncio
+async def test_deepagents_stream_execute_yields_chunks():
+    """_stream_execute yields output incrementally and matches the buffered result."""
+    from bashkit import BashTool
+    from bashkit.deepagents import _stream_execute
+
+    tool = BashTool()
+    script = "for i in 1 2 3; do echo out-$i; echo err-$i >&2; done"
+    chunks = [chunk async for chunk in _stream_execute(tool, script)]
+
+    assert chunks
+    joined = "".join(chunks)
+    for expected in ("out-1", "out-2", "out-3", "err-1", "err-3"):
+        assert expected in joined
+
+
 def test_deepagents_write_heredoc_injection():
     """Content containing the heredoc delimiter must not cause injection."""
     from bashkit import BashTool
@@ -172,27 +172,46 @@ async def answer(
         print(text, end="", flush=True)
         printed = True
 
+    async def print_block_text(content: list) -> None:
+        for block in content:
+            if isinstance(block, dict) and block.get("type") in {
+                "text",
+                "output_text",
+            }:
+                await print_answer_text(str(block.get("text", "")))
+
+    # The chunk content shape is fixed per provider, so resolve the renderer
+    # on the first non-empty chunk instead of re-probing types per token.
+    render = None
+
     try:
-        async for event in agent.astream_events(
+        # astream with explicit stream modes instead of astream_events: only
+        # model tokens ("messages") and tool calls ("updates") are materialized,
+        # not every internal runnable event.
+        async for mode, payload in agent.astream(
             {"messages": [HumanMessage(content=question)]},
-            version="v2",
+            stream_mode=["messages", "updates"],
         ):
-            if show_tools and event["event"] == "on_tool_start":
-                commands = event["data"].get("input", {}).get("commands")
-                if commands:
-                    await stop_spinner()
-                    print(f"$ {commands}", file=sys.stderr, flush=True)
-            elif event["event"] == "on_chat_model_stream":
-                content = event["data"]["chunk"].content
-                if isinstance(content, str):
-                    await print_answer_text(content)
-                elif isinstance(content, list):
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") in {
-                            "text",
-                            "output_text",
-                        }:
-                            await print_answer_text(str(block.get("text", "")))
+            if mode == "updates":
+                if not show_tools:
+                    continue
+                for update in payload.values():
+                    for message in (update or {}).get("messages", []):
+                        for tool_call in getattr(message, "tool_calls", None) or []:
+                            commands = tool_call["args"].get("commands")
+                            if commands:
+                                await stop_spinner()
+                                print(f"$ {commands}", file=sys.stderr, flush=True)
+                continue
+            chunk, _metadata = payload
+            if chunk.type == "tool":
+                continue
+            content = chunk.content
+            if not content:
+                continue
+            if render is None:
+                render = print_answer_text if isinstance(content, str) else print_block_text
+            await render(content)
     finally:
         await stop_spinner()
 
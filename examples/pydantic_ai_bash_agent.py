@@ -3,6 +3,7 @@
 # requires-python = ">=3.10"
 # dependencies = [
 #     "bashkit[pydantic-ai]>=0.1.4",
+#     "uvloop>=0.19; sys_platform != 'win32'",
 # ]
 # ///
 """
@@ -18,14 +19,12 @@ Run:
 uv automatically installs bashkit from PyPI (pre-built wheels, no Rust needed).
 """
 
-import asyncio
 import os
 import sys
 
-from pydantic_ai import Agent
-
-from bashkit.pydantic_ai import create_bash_tool
-
+# pydantic-ai/bashkit imports are deferred into main(): they pull in
+# pydantic, httpx, and the native extension, which is wasted work when the
+# script early-exits on a missing API key.
 
 SYSTEM_PROMPT = """\
 You are a coding assistant with a sandboxed bash environment.
@@ -41,6 +40,10 @@ async def main():
         print("Set ANTHROPIC_API_KEY")
         sys.exit(1)
 
+    from pydantic_ai import Agent
+
+    from bashkit.pydantic_ai import create_bash_tool
+
     print("=" * 60)
     print("  PydanticAI + Bashkit")
     print("=" * 60)
@@ -65,12 +68,19 @@ async def main():
     print(f"\nTask: {task}")
     print("-" * 60)
 
-    result = await agent.run(task)
-    print("\n" + "-" * 60)
-    print("Agent output:")
-    print(result.data)
-    print("=" * 60)
+    print("\nAgent output:")
+    # Stream deltas instead of blocking on the full run: first tokens render
+    # while the rest of the generation (and tool calls) are still in flight.
+    async with agent.run_stream(task) as result:
+        async for delta in result.stream_text(delta=True):
+            print(delta, end="", flush=True)
+    print("\n" + "=" * 60)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # libuv event loop: lower per-callback overhead for streaming workloads.
+    try:
+        from uvloop import run
+    except ImportError:  # unavailable on Windows
+        from asyncio import run
+    run(main())
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""Summarize differential-fuzzing mismatch logs.
+
+The differential proptests compare bashkit against real bash; triage
+harnesses print one record per divergence in this shape:
+
+    MISMATCH:
+      Script: "echo $((1 + 2))"
+      BashKit: "3" (exit 0)
+      Real: "3n" (exit 0)
+
+    BASHKIT_FAILED: "while read x; do echo $x; done"
+
+This tool reads such a log on stdin and prints a per-category breakdown
+(loops, conditionals, arithmetic, echo, variables) with sample scripts,
+so triage starts from the biggest bucket instead of a raw dump:
+
+    cargo test --test proptest_differential -- --nocapture \\
+        | python3 scripts/analyze_mismatches.py
+"""
+
+from __future__ import annotations
+
+import io
+import re
+import sys
+from array import array
+from collections import Counter, defaultdict, deque
+from typing import NamedTuple
+
+# Cargo's differential runs pipe multi-MB logs; 256 KiB reads cut the
+# syscall count ~32x versus the 8 KiB default buffer.
+_STDIN_BUFFER_SIZE = 256 * 1024
+
+class Mismatch(NamedTuple):
+    """A completed record — only the fields the report consumes."""
+
+    script: str
+    bashkit_output: str
+    bashkit_exit: int
+    real_output: str
+    real_exit: int
+
+
+def _set_output_fields(mismatch: dict, line: str, out_key: str, exit_key: str) -> None:
+    """Extract `"output" (exit N)` from a BashKit:/Real: line.
+
+    The grammar is simple enough that linear str scans place both fields
+    directly. Anchors are the outermost quotes: the opener via find, the
+    closer via rfind bounded by the trailing `(exit ` marker (same rfind
+    trick as _h_script), so embedded quotes in the output stay intact.
+    Malformed lines leave the record untouched, matching what the old
+    regex fallback did when it failed to match.
+    """
+    q1 = line.find('"')
+    if q1 == -1:
+        return
+    e1 = line.rfind("(exit ")
+    if e1 == -1:
+        return
+    q2 = line.rfind('"', q1 + 1, e1)
+    if q2 == -1:
+        return
+    e1 += 6
+    e2 = line.find(")", e1)
+    if e2 == -1:
+        return
+    try:
+        exit_code = int(line[e1:e2])
+    except ValueError:
+        return
+    mismatch[out_key] = line[q1 + 1 : q2]
+    mismatch[exit_key] = exit_code
+
+
+def _h_mismatch(line: str, state: dict) -> None:
+    """'M' lines: a MISMATCH: marker opens a fresh record."""
+    if line.startswith("MISMATCH:"):
+        _flush(state["cur"], state["results"])
+        state["cur"] = {}
+
+
+def _h_script(line: str, state: dict) -> None:
+    """'S' lines: the Script: field carries the quoted bash source."""
+    cur = state["cur"]
+    if cur is not None and line.startswith("Script:"):
+        q1 = line.find('"')
+        q2 = line.rfind('"')
+        if q2 > q1 >= 0:
+            cur["script"] = line[q1 + 1 : q2]
+
+
+def _h_bashkit(line: str, state: dict) -> None:
+    """'B' lines: BASHKIT_FAILED: markers and BashKit: output fields."""
+    if line.startswith("BASHKIT_FAILED:"):
+        _flush(state["cur"], state["results"])
+        state["cur"] = None
+        state["results"]["bashkit_failed"] += 1
+    elif state["cur"] is not None and line.startswith("BashKit:"):
+        _set_output_fields(state["cur"], line, "bashkit_output", "bashkit_exit")
+
+
+def _h_real(line: str, state: dict) -> None:
+    """'R' lines: the Real: output field."""
+    cur = state["cur"]
+    if cur is not None and line.startswith("Real:"):
+        _set_output_fields(cur, line, "real_output", "real_exit")
+
+
+def _flush(cur: dict | None, results: dict) -> None:
+    """Tally a completed record; incomplete blocks are dropped.
+
+    The in-flight dict is compacted into a Mismatch tuple here — outputs
+    and exits always land together, so checking the output keys covers
+    both.
+    """
+    if cur is not None and "script" in cur and "bashkit_output" in cur and "real_output" in cur:
+        process_mismatch(
+            Mismatch(
+                cur["script"],
+                cur["bashkit_output"],
+                cur["bashkit_exit"],
+                cur["real_output"],
+                cur["real_exit"],
+            ),
+            results,
+        )
+
+
+# One compiled alternation scans the script once (with re's memchr-based
+# literal prefilter) instead of up to five independent substring passes.
+_CAT_RE = re.compile(r"(for |while )|(if )|(\$\(\()|(echo)")
+# Indexed by _CAT_RE's 1-based lastindex (slot 0 unused). Tuple of module
+# constants: every record reuses the same interned strings as dict keys,
+# so tally inserts hash/compare by identity instead of building new ones.
+_CATS = (None, "loops", "conditionals", "arithmetic", "echo")
+
+
+def categorize_script(script: str) -> str:
+    """Bucket a script by the first recognized construct it exercises."""
+    m = _CAT_RE.search(script)
+    if m is not None:
+        return _CATS[m.lastindex]
+    # Ordered by corpus frequency: the alternation already caught the common
+    # constructs on its single scan, assignments+expansions are the next most
+    # likely shape, and only true leftovers fall through to "other".
+    if "=" in script and "$" in script:
+        return "variables"
+    return "other"
+
+
+def process_mismatch(mismatch: Mismatch, results: dict) -> None:
+    """Fold one parsed mismatch into the running tallies.
+
+    Only counts and a bounded sample window survive per category — the
+    report never needs more than three examples, so records do not
+    accumulate for the lifetime of the run.
+    """
+    category = categorize_script(mismatch.script)
+    results["cat_counts"][category] += 1
+    results["cat_samples"][category].append(mismatch)
+    # Exit codes go into packed SoA columns (4 bytes each, not boxed ints),
+    # which is what makes whole-corpus exit statistics affordable to keep.
+    results["bk_exits"].append(mismatch.bashkit_exit)
+    results["rl_exits"].append(mismatch.real_exit)
+    out_differs = mismatch.bashkit_output != mismatch.real_output
+    exit_differs = mismatch.bashkit_exit != mismatch.real_exit
+    if out_differs and exit_differs:
+        results["both_differ"] += 1
+    elif out_differs:
+        results["output_only"] += 1
+    elif exit_differs:
+        results["exit_code_only"] += 1
+
+
+def print_report(results: dict) -> None:
+    """Emit category tallies, samples, and triage priorities in one write."""
+    total = sum(results["cat_counts"].values())
+    rule = "=" * 60
+    out = [
+        rule,
+        "Differential mismatch report",
+        rule,
+        f"Parsed mismatches: {total}",
+        f"Output only: {results['output_only']}",
+        f"Exit code only: {results['exit_code_only']}",
+        f"Both differ: {results['both_differ']}",
+        f"Bashkit failed (no comparison): {results['bashkit_failed']}",
+    ]
+    pairs = Counter(
+        (bk, rl) for bk, rl in zip(results["bk_exits"], results["rl_exits"]) if bk != rl
+    )
+    if pairs:
+        top = "; ".join(f"{bk}->{rl} x{n}" for (bk, rl), n in pairs.most_common(3))
+        out.append(f"Top exit-code divergences (bashkit->real): {top}")
+    out.append("")
+    out.append("By category:")
+    # Sorted once; the priority section is just the head of the same order.
+    ordered = results["cat_counts"].most_common()
+    for category, count in ordered:
+        out.append(f"  {category}: {count}")
+        out.extend(f"    Script: {sample.script}" for sample in results["cat_samples"][category])
+    out.append("")
+    out.append("Priority recommendations:")
+    out.extend(f"  Fix {category} first ({count} mismatches)" for category, count in ordered[:3])
+    out.append("")
+    # One write for the whole report instead of a line-buffered print each.
+    sys.stdout.write("\n".join(out))
+    sys.stdout.flush()
+
+
+def main() -> int:
+    results: dict = {
+        "cat_counts": Counter(),
+        "cat_samples": defaultdict(lambda: deque(maxlen=3)),
+        "bk_exits": array("i"),
+        "rl_exits": array("i"),
+        "output_only": 0,
+        "exit_code_only": 0,
+        "both_differ": 0,
+        "bashkit_failed": 0,
+    }
+    # Single streaming pass: each completed record is tallied as soon as its
+    # block ends, so neither the input nor any list-of-lines buffer is ever
+    # materialized in memory.
+    try:
+        stdin = io.TextIOWrapper(
+            io.BufferedReader(sys.stdin.buffer.raw, buffer_size=_STDIN_BUFFER_SIZE),
+            encoding="utf-8",
+            errors="replace",
+        )
+    except (AttributeError, io.UnsupportedOperation):
+        stdin = sys.stdin  # non-standard stdin (e.g. already wrapped); keep as-is
+    state: dict = {"cur": None, "results": results}
+    for line in stdin:
+        # Field lines are indented, markers are not, so lstrip is the only
+        # normalization dispatch needs; the handlers' find/startswith logic
+        # is insensitive to the trailing newline. Unindented lines come back
+        # unchanged from lstrip (no copy).
+        stripped = line.lstrip()
+        # The line grammar is fixed, so dispatch is unrolled into direct
+        # first-char compares (in per-block frequency order: three field
+        # lines to one marker) — no dict lookup on the per-line path.
+        c = stripped[:1]
+        if c == "S":
+            _h_script(stripped, state)
+        elif c == "B":
+            _h_bashkit(stripped, state)
+        elif c == "R":
+            _h_real(stripped, state)
+        elif c == "M":
+            _h_mismatch(stripped, state)
+    _flush(state["cur"], results)
+    print_report(results)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,109 @@
+"""Tests for scripts/analyze_mismatches.py (differential-log triage report).
+
+Behavioral, via subprocess on a fixed sample log: the parser internals are
+free to change shape as long as the report stays stable. One case per
+tally class, category bucketing, and the degenerate empty-input report.
+
+unittest.TestCase so `python3 -m unittest discover -s scripts/tests` (wired
+into `just check`) actually executes them; pytest runs them too.
+"""
+
+import pathlib
+import subprocess
+import sys
+import unittest
+
+REPO = pathlib.Path(__file__).resolve().parents[2]
+SCRIPT = REPO / "scripts" / "analyze_mismatches.py"
+
+SAMPLE_LOG = """\
+running 5 tests
+MISMATCH:
+  Script: "x=$((1 + 2)); echo done"
+  BashKit: "done" (exit 0)
+  Real: "donen" (exit 0)
+MISMATCH:
+  Script: "for i in 1 2; do echo $i; done"
+  BashKit: "1 2" (exit 0)
+  Real: "1n2" (exit 1)
+MISMATCH:
+  Script: "if [ 1 -eq 1 ]; then echo yes; fi"
+  BashKit: "yes" (exit 0)
+  Real: "yes" (exit 2)
+MISMATCH:
+  Script: "echo hello world"
+  BashKit: "hello world" (exit 0)
+  Real: "hello  world" (exit 0)
+MISMATCH:
+  Script: "x=1; y=$x; printf %s $y"
+  BashKit: "1" (exit 0)
+  Real: "1" (exit 3)
+BASHKIT_FAILED: "while read x; do echo $x; done"
+test result: FAILED. 0 passed
+"""
+
+
+def run(stdin_text: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(SCRIPT)],
+        input=stdin_text,
+        capture_output=True,
+        text=True,
+    )
+
+
+class AnalyzeMismatchesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.result = run(SAMPLE_LOG)
+
+    def test_exit_code_and_clean_stderr(self) -> None:
+        self.assertEqual(self.result.returncode, 0, self.result.stderr)
+        self.assertEqual(self.result.stderr, "")
+
+    def test_overall_tallies(self) -> None:
+        self.assertIn("Parsed mismatches: 5", self.result.stdout)
+        self.assertIn("Output only: 2", self.result.stdout)
+        self.assertIn("Exit code only: 2", self.result.stdout)
+        self.assertIn("Both differ: 1", self.result.stdout)
+        self.assertIn("Bashkit failed (no comparison): 1", self.result.stdout)
+
+    def test_category_buckets(self) -> None:
+        self.assertIn("arithmetic: 1", self.result.stdout)
+        self.assertIn("loops: 1", self.result.stdout)
+        self.assertIn("conditionals: 1", self.result.stdout)
+        self.assertIn("echo: 1", self.result.stdout)
+        self.assertIn("variables: 1", self.result.stdout)
+
+    def test_samples_listed_under_categories(self) -> None:
+        self.assertIn("Script: for i in 1 2; do echo $i; done", self.result.stdout)
+
+    def test_priority_recommendations_present(self) -> None:
+        self.assertIn("Priority recommendations:", self.result.stdout)
+        self.assertIn("first (1 mismatches)", self.result.stdout)
+
+    def test_empty_input(self) -> None:
+        result = run("")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("Parsed mismatches: 0", result.stdout)
+
+    def test_embedded_quotes_in_output_parsed(self) -> None:
+        log = (
+            "MISMATCH:\n"
+            '  Script: "echo done"\n'
+            '  BashKit: "got "exit 7" here" (exit 0)\n'
+            '  Real: "got "exit 7" here" (exit 1)\n'
+        )
+        result = run(log)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("Parsed mismatches: 1", result.stdout)
+        self.assertIn("Exit code only: 1", result.stdout)
+        self.assertIn("0->1 x1", result.stdout)
+
+    def test_incomplete_block_dropped(self) -> None:
+        result = run('MISMATCH:\n  Script: "echo hi"\n')
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("Parsed mismatches: 0", result.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()